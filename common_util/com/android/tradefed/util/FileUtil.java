@@ -55,6 +55,7 @@ import java.util.LinkedHashSet;
 import java.util.List;
 import java.util.Map;
 import java.util.Set;
+import java.util.regex.Pattern;
 import java.util.stream.Stream;
 import java.util.zip.ZipFile;
 /**
@@ -910,16 +911,22 @@ public class FileUtil {
      * @return the {@link File} or <code>null</code> if it could not be found
      */
     public static File findFile(File dir, String fileName) {
-        if (dir.listFiles() != null) {
-            for (File file : dir.listFiles()) {
+        // Compile the name regex once for the whole recursive search.
+        return findFile(dir, Pattern.compile(fileName));
+    }
+
+    private static File findFile(File dir, Pattern fileNamePattern) {
+        File[] children = dir.listFiles();
+        if (children != null) {
+            for (File file : children) {
                 if (file.isDirectory()) {
-                    File result = findFile(file, fileName);
+                    File result = findFile(file, fileNamePattern);
                     if (result != null) {
                         return result;
                     }
                 }
                 // after exploring the sub-dir, if the dir itself is the only match return it.
-                if (file.getName().matches(fileName)) {
+                if (fileNamePattern.matcher(file.getName()).matches()) {
                     return file;
                 }
             }
@@ -1175,9 +1182,11 @@ public class FileUtil {
      */
     public static Set<String> findFiles(File dir, String filter) throws IOException {
         Set<String> files = new HashSet<>();
+        // Compile the filter once instead of letting String#matches recompile it per entry.
+        Pattern filterPattern = Pattern.compile(filter);
         try (Stream<Path> stream =
                 Files.walk(Paths.get(dir.getAbsolutePath()), FileVisitOption.FOLLOW_LINKS)) {
-            stream.filter(path -> path.getFileName().toString().matches(filter))
+            stream.filter(path -> filterPattern.matcher(path.getFileName().toString()).matches())
                     .forEach(path -> files.add(path.toString()));
         }
         return files;
@@ -1257,9 +1266,11 @@ public class FileUtil {
      */
     public static Set<File> findFilesObject(File dir, String filter) throws IOException {
         Set<File> files = new LinkedHashSet<>();
+        // Compile the filter once instead of letting String#matches recompile it per entry.
+        Pattern filterPattern = Pattern.compile(filter);
         try (Stream<Path> stream =
                 Files.walk(Paths.get(dir.getAbsolutePath()), FileVisitOption.FOLLOW_LINKS)) {
-            stream.filter(path -> path.getFileName().toString().matches(filter))
+            stream.filter(path -> filterPattern.matcher(path.getFileName().toString()).matches())
                     .forEach(path -> files.add(path.toFile()));
         }
         return files;
@@ -1324,11 +1335,15 @@ public class FileUtil {
         Path folder = directory.getAbsoluteFile().toPath();
         try {
             long size = 0;
-            try (Stream<Path> stream = Files.walk(folder, FileVisitOption.FOLLOW_LINKS)) {
-                size =
-                        stream.filter(p -> p.toFile().isFile())
-                                .mapToLong(p -> p.toFile().length())
-                                .sum();
+            // Files.find exposes the attributes read during the walk, so filtering on regular
+            // files does not re-stat every path the way File#isFile would.
+            try (Stream<Path> stream =
+                    Files.find(
+                            folder,
+                            Integer.MAX_VALUE,
+                            (p, attrs) -> attrs.isRegularFile(),
+                            FileVisitOption.FOLLOW_LINKS)) {
+                size = stream.mapToLong(p -> p.toFile().length()).sum();
             }
             CLog.d(
                     "Directory '%s' has size: %s. Contains: %s",
@@ -34,7 +34,7 @@ public class TimeUtil {
      */
     public static String formatElapsedTime(long elapsedTimeMs) {
         if (elapsedTimeMs < 1000) {
-            return String.format("%d ms", elapsedTimeMs);
+            return elapsedTimeMs + " ms";
         }
         long seconds = TimeUnit.MILLISECONDS.toSeconds(elapsedTimeMs) % 60;
         long minutes = TimeUnit.MILLISECONDS.toMinutes(elapsedTimeMs) % 60;
@@ -54,6 +54,13 @@ public class TestMappingTest {
     private static final String TEST_MAPPING = "TEST_MAPPING";
     private static final String TEST_MAPPINGS_ZIP = "test_mappings.zip";
     private static final String DISABLED_PRESUBMIT_TESTS = "disabled-presubmit-tests";
+    // Resource paths shared across tests, built once instead of per test case.
+    private static final String TEST_MAPPING_1_RESOURCE =
+            File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+    private static final String TEST_MAPPING_2_RESOURCE =
+            File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+    private static final String DISABLED_PRESUBMIT_TESTS_RESOURCE =
+            File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
 
     /** Test for {@link TestMapping#getTests()} implementation. */
     @Test
@@ -63,7 +70,7 @@ public class TestMappingTest {
 
         try {
             tempDir = FileUtil.createTempDir("test_mapping");
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             File testMappingRootDir = FileUtil.createTempDir("subdir", tempDir);
             String rootDirName = testMappingRootDir.getName();
@@ -150,14 +157,14 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
 
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
+            srcFile = DISABLED_PRESUBMIT_TESTS_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, tempDir, DISABLED_PRESUBMIT_TESTS);
             List<File> filesToZip =
@@ -203,14 +210,14 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
 
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
+            srcFile = DISABLED_PRESUBMIT_TESTS_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, tempDir, DISABLED_PRESUBMIT_TESTS);
             List<File> filesToZip =
@@ -242,11 +249,11 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
             Path testMappingsRootPath = Paths.get(tempDir.getAbsolutePath());
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
 
@@ -273,11 +280,11 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
             Path testMappingsRootPath = Paths.get(tempDir.getAbsolutePath());
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
 
@@ -499,14 +506,14 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
 
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
+            srcFile = DISABLED_PRESUBMIT_TESTS_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, tempDir, DISABLED_PRESUBMIT_TESTS);
 
@@ -533,14 +540,14 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
 
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
+            srcFile = DISABLED_PRESUBMIT_TESTS_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, tempDir, DISABLED_PRESUBMIT_TESTS);
             List<File> filesToZip =
@@ -573,14 +580,14 @@ public class TestMappingTest {
             tempDir = FileUtil.createTempDir("test_mapping");
 
             File srcDir = FileUtil.createTempDir("src", tempDir);
-            String srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_1";
+            String srcFile = TEST_MAPPING_1_RESOURCE;
             InputStream resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, srcDir, TEST_MAPPING);
             File subDir = FileUtil.createTempDir("sub_dir", srcDir);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + "test_mapping_2";
+            srcFile = TEST_MAPPING_2_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, subDir, TEST_MAPPING);
-            srcFile = File.separator + TEST_DATA_DIR + File.separator + DISABLED_PRESUBMIT_TESTS;
+            srcFile = DISABLED_PRESUBMIT_TESTS_RESOURCE;
             resourceStream = this.getClass().getResourceAsStream(srcFile);
             FileUtil.saveResourceFile(resourceStream, tempDir, DISABLED_PRESUBMIT_TESTS);
             Path tempDirPath = Paths.get(tempDir.getAbsolutePath());
@@ -22,7 +22,9 @@ import com.android.tradefed.util.MultiMap;
 
 import org.kxml2.io.KXmlSerializer;
 
+import java.io.BufferedReader;
 import java.io.File;
+import java.io.FileReader;
 import java.io.IOException;
 import java.io.PrintWriter;
 import java.lang.reflect.Field;
@@ -36,6 +38,7 @@ import java.util.List;
 import java.util.Map;
 import java.util.Map.Entry;
 import java.util.Set;
+import java.util.stream.Collectors;
 
 /** Utility functions to handle configuration files. */
 public class ConfigurationUtil {
@@ -277,9 +280,14 @@ public class ConfigurationUtil {
                 continue;
             }
             try {
-                for (String configNamePattern : configNamePatterns) {
-                    configNames.addAll(FileUtil.findFilesObject(dir, configNamePattern));
-                }
+                // Combine the patterns into a single alternation so the directory tree is
+                // walked once instead of once per pattern.
+                String combinedPattern =
+                        configNamePatterns
+                                .stream()
+                                .map(p -> "(?:" + p + ")")
+                                .collect(Collectors.joining("|"));
+                configNames.addAll(FileUtil.findFilesObject(dir, combinedPattern));
             } catch (IOException e) {
                 CLog.w("Failed to get test config files from directory %s", dir.getAbsolutePath());
             }
@@ -295,7 +303,7 @@ public class ConfigurationUtil {
         Map<String, File> newMap = new LinkedHashMap<>();
         for (File f : origSet) {
             try {
-                if (!FileUtil.readStringFromFile(f).contains("<configuration")) {
+                if (!containsConfigurationTag(f)) {
                     CLog.e("%s doesn't look like a test configuration.", f);
                     continue;
                 }
@@ -304,10 +312,27 @@ public class ConfigurationUtil {
                 continue;
             }
             // Always keep the first found
-            if (!newMap.keySet().contains(f.getName())) {
-                newMap.put(f.getName(), f);
+            String name = f.getName();
+            if (!newMap.containsKey(name)) {
+                newMap.put(name, f);
             }
         }
         return new LinkedHashSet<>(newMap.values());
     }
+
+    /**
+     * Check whether a file contains a &lt;configuration&gt; tag, without loading the whole file in
+     * memory: the tag is expected near the top, so stop reading at the first match.
+     */
+    private static boolean containsConfigurationTag(File file) throws IOException {
+        try (BufferedReader reader = new BufferedReader(new FileReader(file))) {
+            String line;
+            while ((line = reader.readLine()) != null) {
+                if (line.contains("<configuration")) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
 }
@@ -43,6 +43,11 @@ import java.util.regex.Pattern;
 /** Sharding strategy to create strict shards that do not report together, */
 public class StrictShardHelper extends ShardHelper {
 
+    // Pattern used to identify the parameterized mainline modules defined in the square
+    // brackets.
+    private static final Pattern PARAMETERIZED_MAINLINE_REGEX =
+            Pattern.compile("\\[(.*(\\.apk|.apex|.apks))\\]$");
+
     /** {@inheritDoc} */
     @Override
     public boolean shardConfig(
@@ -104,10 +109,7 @@ public class StrictShardHelper extends ShardHelper {
      * @throws RuntimeException if the module name doesn't match the pattern for mainline modules.
      */
     private String getMainlineId(String id) {
-        // Pattern used to identify the parameterized mainline modules defined in the square
-        // brackets.
-        Pattern parameterizedMainlineRegex = Pattern.compile("\\[(.*(\\.apk|.apex|.apks))\\]$");
-        Matcher m = parameterizedMainlineRegex.matcher(id);
+        Matcher m = PARAMETERIZED_MAINLINE_REGEX.matcher(id);
         if (m.find()) {
             return m.group(1);
         }
@@ -313,8 +313,7 @@ public class SubprocessResultsReporter
             if (mReportFile.canWrite()) {
                 try {
                     try (FileWriter fw = new FileWriter(mReportFile, true)) {
-                        String eventLog = String.format("%s %s\n", key, event.toString());
-                        fw.append(eventLog);
+                        fw.append(formatEventLog(key, event));
                         fw.flush();
                     }
                 } catch (IOException e) {
@@ -339,8 +338,7 @@ public class SubprocessResultsReporter
                     if (!mReportSocket.isConnected()) {
                         throw new RuntimeException("Reporter Socket is not connected");
                     }
-                    String eventLog = String.format("%s %s\n", key, event.toString());
-                    mPrintWriter.print(eventLog);
+                    mPrintWriter.print(formatEventLog(key, event));
                     mPrintWriter.flush();
                 }
             } catch (IOException e) {
@@ -356,6 +354,11 @@ public class SubprocessResultsReporter
         }
     }
 
+    /** Assemble the single-line wire format shared by the file and socket reporters. */
+    private static String formatEventLog(String key, Object event) {
+        return key + " " + event.toString() + "\n";
+    }
+
     /** {@inheritDoc} */
     @Override
     public void close() {
@@ -53,14 +53,17 @@ import com.android.tradefed.util.UniqueMultiMap;
 
 import org.junit.Assert;
 
+import java.io.BufferedOutputStream;
 import java.io.File;
 import java.io.FileOutputStream;
 import java.io.IOException;
+import java.io.OutputStream;
 import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.HashMap;
 import java.util.LinkedHashSet;
 import java.util.List;
+import java.util.Map;
 import java.util.Set;
 
 /**
@@ -229,9 +232,13 @@ public abstract class SubprocessTfLauncher
         mRootDir = rootDirFile.getAbsolutePath();
         String jarClasspath = "";
         List<String> paths = new ArrayList<>();
+        // One walk of the build dir locates all the jars at once, instead of a full
+        // FileUtil.findFile walk per entry of TRADEFED_JARS.
+        Map<String, File> foundJars = new HashMap<>();
+        findTradefedJars(rootDirFile, foundJars);
         for (String jar : TRADEFED_JARS) {
-            File f = FileUtil.findFile(rootDirFile, jar);
-            if (f != null && f.exists()) {
+            File f = foundJars.get(jar);
+            if (f != null) {
                 paths.add(f.getAbsolutePath());
             }
         }
@@ -300,6 +307,33 @@ public abstract class SubprocessTfLauncher
         }
     }
 
+    /**
+     * Recursively search the given directory, recording the first match for each entry of {@link
+     * #TRADEFED_JARS}. Follows the same depth-first order as {@link FileUtil#findFile(File,
+     * String)} so the jar picked for each name is unchanged.
+     */
+    private static void findTradefedJars(File dir, Map<String, File> results) {
+        if (results.size() == TRADEFED_JARS.size()) {
+            return;
+        }
+        File[] children = dir.listFiles();
+        if (children == null) {
+            return;
+        }
+        for (File child : children) {
+            if (child.isDirectory()) {
+                findTradefedJars(child, results);
+            }
+            String name = child.getName();
+            for (String jar : TRADEFED_JARS) {
+                if (!results.containsKey(jar) && name.matches(jar)) {
+                    results.put(jar, child);
+                    break;
+                }
+            }
+        }
+    }
+
     /**
      * Allow to add extra java parameters to the subprocess invocation.
      *
@@ -349,8 +383,8 @@ public abstract class SubprocessTfLauncher
         File eventFile = null;
         SubprocessTestResultsParser eventParser = null;
         StreamProtoReceiver protoReceiver = null;
-        FileOutputStream stdout = null;
-        FileOutputStream stderr = null;
+        OutputStream stdout = null;
+        OutputStream stderr = null;
 
         boolean exception = false;
         long startTime = 0L;
@@ -358,8 +392,10 @@ public abstract class SubprocessTfLauncher
         try {
             stdoutFile = FileUtil.createTempFile("stdout_subprocess_", ".log");
             stderrFile = FileUtil.createTempFile("stderr_subprocess_", ".log");
-            stderr = new FileOutputStream(stderrFile);
-            stdout = new FileOutputStream(stdoutFile);
+            // Buffer the redirected outputs so a chatty subprocess does not cost one file write
+            // per pipe read.
+            stderr = new BufferedOutputStream(new FileOutputStream(stderrFile));
+            stdout = new BufferedOutputStream(new FileOutputStream(stdoutFile));
 
             if (mUseProtoReporting) {
                 protoReceiver = new StreamProtoReceiver(listener, mContext, false, false);
@@ -380,6 +416,9 @@ public abstract class SubprocessTfLauncher
             startTime = System.currentTimeMillis();
             CommandResult result = mRunUtil.runTimedCmd(mMaxTfRunTime, stdout,
                     stderr, mCmdArgs.toArray(new String[0]));
+            // The log files are read back below before the streams are closed.
+            stdout.flush();
+            stderr.flush();
 
             if (eventParser != null) {
                 if (eventParser.getStartTime() != null) {
@@ -393,7 +432,7 @@ public abstract class SubprocessTfLauncher
                     throw new RuntimeException(
                             String.format(
                                     "Event receiver thread did not complete:" + "\n%s",
-                                    FileUtil.readStringFromFile(stderrFile)));
+                                    readStderrTail(stderrFile)));
                 }
             } else if (protoReceiver != null) {
                 if (!protoReceiver.joinReceiver(EVENT_THREAD_JOIN_TIMEOUT_MS)) {
@@ -401,7 +440,7 @@ public abstract class SubprocessTfLauncher
                     throw new RuntimeException(
                             String.format(
                                     "Event receiver thread did not complete:" + "\n%s",
-                                    FileUtil.readStringFromFile(stderrFile)));
+                                    readStderrTail(stderrFile)));
                 }
                 protoReceiver.completeModuleEvents();
             }
@@ -455,6 +494,23 @@ public abstract class SubprocessTfLauncher
         }
     }
 
+    /**
+     * Read the end of the subprocess stderr for an error message, without loading a potentially
+     * large log in memory. The full file is still logged separately.
+     *
+     * @param stderrFile the stderr log file of the subprocess.
+     * @return the last part of the stderr content.
+     */
+    private String readStderrTail(File stderrFile) {
+        final long maxBytes = 64 * 1024;
+        try {
+            return FileUtil.readStringFromFile(
+                    stderrFile, Math.max(0L, stderrFile.length() - maxBytes), maxBytes);
+        } catch (IOException e) {
+            return String.format("Failed to read stderr file: %s", e.getMessage());
+        }
+    }
+
     /**
      * Log the content of given file to listener, then remove the file.
      *
@@ -493,11 +549,9 @@ public abstract class SubprocessTfLauncher
         listener.testRunStarted("StdErr", 1);
         TestDescription tid = new TestDescription("stderr-test", "checkIsEmpty");
         listener.testStarted(tid);
-        if (!FileUtil.readStringFromFile(stdErrFile).isEmpty()) {
-            String trace =
-                    String.format(
-                            "Found some output in stderr:\n%s",
-                            FileUtil.readStringFromFile(stdErrFile));
+        String stdErr = FileUtil.readStringFromFile(stdErrFile);
+        if (!stdErr.isEmpty()) {
+            String trace = String.format("Found some output in stderr:\n%s", stdErr);
             listener.testFailed(tid, FailureDescription.create(trace));
         }
         listener.testEnded(tid, new HashMap<String, Metric>());
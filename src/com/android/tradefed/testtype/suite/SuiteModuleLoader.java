@@ -93,6 +93,8 @@ public class SuiteModuleLoader {
     // Check the mainline parameter configured in a test config must end with .apk, .apks, or .apex.
     private static final Set<String> MAINLINE_PARAMETERS_TO_VALIDATE =
             new HashSet<>(Arrays.asList(".apk", ".apks", ".apex"));
+    // Pattern used to parse an option name carrying a "{alias}name" prefix.
+    private static final Pattern ALIAS_OPTION_PATTERN = Pattern.compile("\\{(.*)\\}(.*)");
 
     /**
      * Ctor for the SuiteModuleLoader.
@@ -678,8 +680,7 @@ public class SuiteModuleLoader {
                         "Expected delimiter ':' between option name and values.");
             }
             String optionName = remainder.substring(0, optionNameSep);
-            Pattern pattern = Pattern.compile("\\{(.*)\\}(.*)");
-            Matcher match = pattern.matcher(optionName);
+            Matcher match = ALIAS_OPTION_PATTERN.matcher(optionName);
             if (match.find()) {
                 String alias = match.group(1);
                 String name = match.group(2);
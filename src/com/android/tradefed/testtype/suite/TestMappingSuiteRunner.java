@@ -30,6 +30,8 @@ import com.google.common.annotations.VisibleForTesting;
 import java.io.File;
 import java.time.Duration;
 import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashMap;
 import java.util.HashSet;
 import java.util.LinkedHashMap;
 import java.util.List;
@@ -113,8 +115,9 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
     @Override
     public LinkedHashMap<String, IConfiguration> loadTests() {
         Set<String> includeFilter = getIncludeFilter();
-        // Name of the tests
-        Set<String> testNames = new HashSet<>();
+        // Test infos to run, grouped by module name so each module looks up its test infos
+        // with a single map query instead of rescanning the whole set.
+        Map<String, Set<TestInfo>> testInfosByName = new HashMap<>();
         Set<TestInfo> testInfosToRun = new HashSet<>();
         if (mTestGroup == null && includeFilter.isEmpty()) {
             throw new RuntimeException(
@@ -160,10 +163,13 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
                 throw new RuntimeException(
                         String.format("No test found for the given group: %s.", mTestGroup));
             }
+            // A single pass provides both the grouping and the module names to include.
             for (TestInfo testInfo : testInfosToRun) {
-                testNames.add(testInfo.getName());
+                testInfosByName
+                        .computeIfAbsent(testInfo.getName(), name -> new HashSet<>())
+                        .add(testInfo);
             }
-            setIncludeFilter(testNames);
+            setIncludeFilter(new HashSet<>(testInfosByName.keySet()));
             // With include filters being set, the test no longer needs group and path settings.
             // Clear the settings to avoid conflict when the test is running in a shard.
             mTestGroup = null;
@@ -182,9 +188,10 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
                     moduleConfig.getConfigurationDescription();
             IAbi abi = configDescriptor.getAbi();
             // Get the parameterized module name by striping the abi information out.
-            String moduleName = entry.getKey().replace(String.format("%s ", abi.getName()), "");
+            String moduleName = entry.getKey().replace(abi.getName() + " ", "");
             String configPath = moduleConfig.getName();
-            Set<TestInfo> testInfos = getTestInfos(testInfosToRun, moduleName);
+            Set<TestInfo> testInfos =
+                    testInfosByName.getOrDefault(moduleName, Collections.emptySet());
             // Only keep the same matching abi runner
             allTests.addAll(createIndividualTests(testInfos, moduleConfig, abi));
             if (!allTests.isEmpty()) {
@@ -234,7 +241,7 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
         List<IRemoteTest> tests = new ArrayList<>();
         String configPath = moduleConfig.getName();
         if (configPath == null) {
-            throw new RuntimeException(String.format("Configuration path is null."));
+            throw new RuntimeException("Configuration path is null.");
         }
         File configFile = new File(configPath);
         if (!configFile.exists()) {
@@ -255,8 +262,8 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
             parseOptions(testInfo);
             LinkedHashMap<String, IConfiguration> config = super.loadTests();
             for (Map.Entry<String, IConfiguration> entry : config.entrySet()) {
-                if (entry.getValue().getConfigurationDescription().getAbi() != null
-                        && !entry.getValue().getConfigurationDescription().getAbi().equals(abi)) {
+                IAbi configAbi = entry.getValue().getConfigurationDescription().getAbi();
+                if (configAbi != null && !configAbi.equals(abi)) {
                     continue;
                 }
                 List<IRemoteTest> remoteTests = entry.getValue().getTests();
@@ -306,23 +313,22 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
         // module-arg options compiled from test options for each test.
         Set<String> moduleArgs = new HashSet<>();
         Set<String> testNames = new HashSet<>();
+        String testName = testInfo.getName();
         for (TestOption option : testInfo.getOptions()) {
+            String optionValue = option.getValue();
             switch (option.getName()) {
                 // Handle include and exclude filter at the suite level to hide each
                 // test runner specific implementation and option names related to filtering
                 case TEST_MAPPING_INCLUDE_FILTER:
-                    mappingIncludeFilters.add(
-                            String.format("%s %s", testInfo.getName(), option.getValue()));
+                    mappingIncludeFilters.add(testName + " " + optionValue);
                     break;
                 case TEST_MAPPING_EXCLUDE_FILTER:
-                    mappingExcludeFilters.add(
-                            String.format("%s %s", testInfo.getName(), option.getValue()));
+                    mappingExcludeFilters.add(testName + " " + optionValue);
                     break;
                 default:
-                    String moduleArg =
-                            String.format("%s:%s", testInfo.getName(), option.getName());
-                    if (option.getValue() != null && !option.getValue().isEmpty()) {
-                        moduleArg = String.format("%s:%s", moduleArg, option.getValue());
+                    String moduleArg = testName + ":" + option.getName();
+                    if (optionValue != null && !optionValue.isEmpty()) {
+                        moduleArg = moduleArg + ":" + optionValue;
                     }
                     moduleArgs.add(moduleArg);
                     break;
@@ -330,7 +336,7 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
         }
 
         if (mappingIncludeFilters.isEmpty()) {
-            testNames.add(testInfo.getName());
+            testNames.add(testName);
             setIncludeFilter(testNames);
         } else {
             setIncludeFilter(mappingIncludeFilters);
@@ -349,13 +355,17 @@ public class TestMappingSuiteRunner extends BaseTestSuite {
      */
     @VisibleForTesting
     Set<TestInfo> dedupTestInfos(Set<TestInfo> testInfos) {
+        if (testInfos.size() <= 1) {
+            // Nothing to de-duplicate.
+            return testInfos;
+        }
         Set<String> nameOptions = new HashSet<>();
         Set<TestInfo> dedupTestInfos = new HashSet<>();
         for (TestInfo testInfo : testInfos) {
             String nameOption = testInfo.getName() + testInfo.getOptions().toString();
-            if (!nameOptions.contains(nameOption)) {
+            // add() reports whether the key was new, saving a second lookup via contains().
+            if (nameOptions.add(nameOption)) {
                 dedupTestInfos.add(testInfo);
-                nameOptions.add(nameOption);
             }
         }
         return dedupTestInfos;
@@ -91,8 +91,10 @@ public class BundletoolUtil {
                                 outputDirArg,
                                 deviceIdArg));
 
-        if (getAdbPath() != null) {
-            generateDeviceSpecCmd.add("--adb=" + getAdbPath());
+        // getAdbPath() stats the adb binary, so resolve it once.
+        String adbPath = getAdbPath();
+        if (adbPath != null) {
+            generateDeviceSpecCmd.add("--adb=" + adbPath);
         }
 
         CommandResult res =
@@ -177,8 +179,10 @@ public class BundletoolUtil {
                                 inputPathArg,
                                 deviceIdArg));
 
-        if (getAdbPath() != null) {
-            installApksCmd.add("--adb=" + getAdbPath());
+        // getAdbPath() stats the adb binary, so resolve it once.
+        String adbPath = getAdbPath();
+        if (adbPath != null) {
+            installApksCmd.add("--adb=" + adbPath);
         }
 
         CommandResult res =
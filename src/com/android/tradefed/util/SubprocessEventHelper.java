@@ -239,16 +239,18 @@ public class SubprocessEventHelper {
             String stack = jsonObject.getString(CAUSE_KEY);
             mCause = new Throwable(stack);
 
-            if (!Strings.isNullOrEmpty(jsonObject.optString(REASON_KEY))) {
+            String reason = jsonObject.optString(REASON_KEY);
+            if (!Strings.isNullOrEmpty(reason)) {
                 mFailure =
-                        FailureDescription.create(jsonObject.optString(REASON_KEY))
+                        FailureDescription.create(reason)
                                 .setOrigin(jsonObject.optString(ERROR_ORIGIN_KEY))
                                 .setCause(mCause);
                 // FailureStatus
                 FailureStatus status = FailureStatus.UNSET;
-                if (!Strings.isNullOrEmpty(jsonObject.optString(FAILURE_STATUS_KEY))) {
+                String statusString = jsonObject.optString(FAILURE_STATUS_KEY);
+                if (!Strings.isNullOrEmpty(statusString)) {
                     try {
-                        status = FailureStatus.valueOf(jsonObject.optString(FAILURE_STATUS_KEY));
+                        status = FailureStatus.valueOf(statusString);
                     } catch (NullPointerException | IllegalArgumentException e) {
                         CLog.e(e);
                     }
@@ -256,11 +258,10 @@ public class SubprocessEventHelper {
                 mFailure.setFailureStatus(status);
                 // ActionInProgress
                 ActionInProgress action = ActionInProgress.UNSET;
-                if (!Strings.isNullOrEmpty(jsonObject.optString(ACTION_IN_PROGRESS_KEY))) {
+                String actionString = jsonObject.optString(ACTION_IN_PROGRESS_KEY);
+                if (!Strings.isNullOrEmpty(actionString)) {
                     try {
-                        action =
-                                ActionInProgress.valueOf(
-                                        jsonObject.optString(ACTION_IN_PROGRESS_KEY));
+                        action = ActionInProgress.valueOf(actionString);
                     } catch (NullPointerException | IllegalArgumentException e) {
                         CLog.e(e);
                     }
@@ -515,10 +516,11 @@ public class SubprocessEventHelper {
         public TestLogEventInfo(JSONObject jsonObject) throws JSONException {
             mDataName = jsonObject.getString(DATA_NAME_KEY);
             jsonObject.remove(DATA_NAME_KEY);
+            String dataType = jsonObject.getString(DATA_TYPE_KEY);
             try {
-                mLogType = LogDataType.valueOf(jsonObject.getString(DATA_TYPE_KEY));
+                mLogType = LogDataType.valueOf(dataType);
             } catch (IllegalArgumentException e) {
-                CLog.e("Failed to parse type: %s", jsonObject.getString(DATA_TYPE_KEY));
+                CLog.e("Failed to parse type: %s", dataType);
                 mLogType = LogDataType.TEXT;
             }
             jsonObject.remove(DATA_TYPE_KEY);
@@ -700,9 +702,10 @@ public class SubprocessEventHelper {
         failure.setOrigin(jsonObject.optString(ERROR_ORIGIN_KEY));
         // FailureStatus
         FailureStatus status = FailureStatus.UNSET;
-        if (!Strings.isNullOrEmpty(jsonObject.optString(FAILURE_STATUS_KEY))) {
+        String statusString = jsonObject.optString(FAILURE_STATUS_KEY);
+        if (!Strings.isNullOrEmpty(statusString)) {
             try {
-                status = FailureStatus.valueOf(jsonObject.optString(FAILURE_STATUS_KEY));
+                status = FailureStatus.valueOf(statusString);
             } catch (NullPointerException | IllegalArgumentException e) {
                 CLog.e(e);
             }
@@ -710,9 +713,10 @@ public class SubprocessEventHelper {
         failure.setFailureStatus(status);
         // ActionInProgress
         ActionInProgress action = ActionInProgress.UNSET;
-        if (!Strings.isNullOrEmpty(jsonObject.optString(ACTION_IN_PROGRESS_KEY))) {
+        String actionString = jsonObject.optString(ACTION_IN_PROGRESS_KEY);
+        if (!Strings.isNullOrEmpty(actionString)) {
             try {
-                action = ActionInProgress.valueOf(jsonObject.optString(ACTION_IN_PROGRESS_KEY));
+                action = ActionInProgress.valueOf(actionString);
             } catch (NullPointerException | IllegalArgumentException e) {
                 CLog.e(e);
             }
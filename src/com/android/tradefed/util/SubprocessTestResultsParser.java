@@ -55,14 +55,12 @@ import org.json.JSONObject;
 import java.io.BufferedReader;
 import java.io.Closeable;
 import java.io.File;
-import java.io.FileNotFoundException;
 import java.io.FileOutputStream;
 import java.io.FileReader;
 import java.io.IOException;
 import java.io.InputStreamReader;
 import java.net.ServerSocket;
 import java.net.Socket;
-import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.HashSet;
 import java.util.List;
@@ -85,7 +83,29 @@ public class SubprocessTestResultsParser implements Closeable {
     private IInvocationContext mCurrentModuleContext = null;
     private InvocationFailedEventInfo mReportedInvocationFailedEventInfo = null;
 
-    private Pattern mPattern = null;
+    // The event keys are fixed, so the line pattern is the same for every parser instance.
+    private static final Pattern EVENT_PATTERN =
+            Pattern.compile(
+                    String.format(
+                            "(.*)(%s)( )(.*)",
+                            String.join(
+                                    "|",
+                                    StatusKeys.INVOCATION_FAILED,
+                                    StatusKeys.TEST_ASSUMPTION_FAILURE,
+                                    StatusKeys.TEST_ENDED,
+                                    StatusKeys.TEST_FAILED,
+                                    StatusKeys.TEST_IGNORED,
+                                    StatusKeys.TEST_STARTED,
+                                    StatusKeys.TEST_RUN_ENDED,
+                                    StatusKeys.TEST_RUN_FAILED,
+                                    StatusKeys.TEST_RUN_STARTED,
+                                    StatusKeys.TEST_MODULE_STARTED,
+                                    StatusKeys.TEST_MODULE_ENDED,
+                                    StatusKeys.TEST_LOG,
+                                    StatusKeys.LOG_ASSOCIATION,
+                                    StatusKeys.INVOCATION_STARTED,
+                                    StatusKeys.INVOCATION_ENDED)));
+
     private Map<String, EventHandler> mHandlerMap = null;
     private EventReceiverThread mEventReceiver = null;
     private IInvocationContext mContext = null;
@@ -118,6 +138,10 @@ public class SubprocessTestResultsParser implements Closeable {
      * Internal receiver thread class with a socket.
      */
     private class EventReceiverThread extends Thread {
+        // Size of the read buffer over the event socket. A chatty subprocess can stream tens of
+        // thousands of events, so read in large chunks to limit the number of underlying reads.
+        private static final int READER_BUFFER_SIZE = 64 * 1024;
+
         private ServerSocket mSocket;
         // initial state: 1 permit available, joins that don't wait for connection will succeed
         private Semaphore mSemaphore = new Semaphore(1);
@@ -165,7 +189,10 @@ public class SubprocessTestResultsParser implements Closeable {
             try {
                 client = mSocket.accept();
                 mSemaphore.acquire(); // connected: 0 permits available, all joins will wait
-                in = new BufferedReader(new InputStreamReader(client.getInputStream()));
+                in =
+                        new BufferedReader(
+                                new InputStreamReader(client.getInputStream()),
+                                READER_BUFFER_SIZE);
                 String event = null;
                 while ((event = in.readLine()) != null) {
                     try {
@@ -273,24 +300,6 @@ public class SubprocessTestResultsParser implements Closeable {
             ITestInvocationListener listener, IInvocationContext context) {
         mListener = listener;
         mContext = context;
-        StringBuilder sb = new StringBuilder();
-        sb.append(StatusKeys.INVOCATION_FAILED).append("|");
-        sb.append(StatusKeys.TEST_ASSUMPTION_FAILURE).append("|");
-        sb.append(StatusKeys.TEST_ENDED).append("|");
-        sb.append(StatusKeys.TEST_FAILED).append("|");
-        sb.append(StatusKeys.TEST_IGNORED).append("|");
-        sb.append(StatusKeys.TEST_STARTED).append("|");
-        sb.append(StatusKeys.TEST_RUN_ENDED).append("|");
-        sb.append(StatusKeys.TEST_RUN_FAILED).append("|");
-        sb.append(StatusKeys.TEST_RUN_STARTED).append("|");
-        sb.append(StatusKeys.TEST_MODULE_STARTED).append("|");
-        sb.append(StatusKeys.TEST_MODULE_ENDED).append("|");
-        sb.append(StatusKeys.TEST_LOG).append("|");
-        sb.append(StatusKeys.LOG_ASSOCIATION).append("|");
-        sb.append(StatusKeys.INVOCATION_STARTED).append("|");
-        sb.append(StatusKeys.INVOCATION_ENDED);
-        String patt = String.format("(.*)(%s)( )(.*)", sb.toString());
-        mPattern = Pattern.compile(patt);
 
         // Create Handler map for each event
         mHandlerMap = new HashMap<String, EventHandler>();
@@ -313,25 +322,16 @@ public class SubprocessTestResultsParser implements Closeable {
     }
 
     public void parseFile(File file) {
-        BufferedReader reader = null;
-        try {
-            reader = new BufferedReader(new FileReader(file));
-        } catch (FileNotFoundException e) {
-            CLog.e(e);
-            throw new RuntimeException(e);
-        }
-        ArrayList<String> listString = new ArrayList<String>();
-        String line = null;
-        try {
+        // Parse each line as it is read instead of materializing the whole file in memory.
+        try (BufferedReader reader = new BufferedReader(new FileReader(file))) {
+            String line = null;
             while ((line = reader.readLine()) != null) {
-                listString.add(line);
+                parse(line);
             }
-            reader.close();
-        } catch (IOException e) {
+        } catch (IOException | JSONException e) {
             CLog.e(e);
             throw new RuntimeException(e);
         }
-        processNewLines(listString.toArray(new String[listString.size()]));
     }
 
     /**
@@ -353,7 +353,7 @@ public class SubprocessTestResultsParser implements Closeable {
      * Parse a line, if it matches one of the events, handle it.
      */
     private void parse(String line) throws JSONException {
-        Matcher matcher = mPattern.matcher(line);
+        Matcher matcher = EVENT_PATTERN.matcher(line);
         if (matcher.find()) {
             EventHandler handler = mHandlerMap.get(matcher.group(2));
             if (handler != null) {
@@ -522,7 +522,7 @@ public class SubprocessTestResultsParser implements Closeable {
                 FileUtil.deleteFile(logInfo.mDataFile);
                 return;
             }
-            String name = String.format("subprocess-%s", logInfo.mDataName);
+            String name = "subprocess-" + logInfo.mDataName;
             try (InputStreamSource data = new FileInputStreamSource(logInfo.mDataFile, true)) {
                 mListener.testLog(name, logInfo.mLogType, data);
                 mTestLogged.add(logInfo.mDataName);
@@ -541,7 +541,7 @@ public class SubprocessTestResultsParser implements Closeable {
                 return;
             }
             File path = new File(file.getPath());
-            String name = String.format("subprocess-%s", assosInfo.mDataName);
+            String name = "subprocess-" + assosInfo.mDataName;
             if (Strings.isNullOrEmpty(file.getUrl()) && path.exists()) {
                 if (mTestLogged.contains(assosInfo.mDataName)) {
                     CLog.d(
@@ -609,11 +609,12 @@ public class SubprocessTestResultsParser implements Closeable {
             if (!infos.isEmpty()) {
                 Map<String, String> attributes = eventEnd.mBuildAttributes;
                 for (InvocationGroupMetricKey groupKey : InvocationGroupMetricKey.values()) {
+                    String groupPrefix = groupKey.toString() + ":";
                     Set<String> attKeys = new HashSet<>(attributes.keySet());
                     for (String attKey : attKeys) {
-                        if (attKey.startsWith(groupKey.toString() + ":")) {
+                        if (attKey.startsWith(groupPrefix)) {
                             String value = attributes.remove(attKey);
-                            String group = attKey.split(":", 2)[1];
+                            String group = attKey.substring(groupPrefix.length());
                             if (groupKey.shouldAdd()) {
                                 try {
                                     InvocationMetricLogger.addInvocationMetrics(
@@ -628,15 +629,15 @@ public class SubprocessTestResultsParser implements Closeable {
                             } else {
                                 InvocationMetricLogger.addInvocationMetrics(groupKey, group, value);
                             }
-                            attributes.remove(attKey);
                         }
                     }
                 }
                 for (InvocationMetricKey key : InvocationMetricKey.values()) {
-                    if (!attributes.containsKey(key.toString())) {
+                    String keyName = key.toString();
+                    if (!attributes.containsKey(keyName)) {
                         continue;
                     }
-                    String val = attributes.remove(key.toString());
+                    String val = attributes.remove(keyName);
                     if (key.shouldAdd()) {
                         try {
                             InvocationMetricLogger.addInvocationMetrics(key, Long.parseLong(val));
@@ -648,7 +649,6 @@ public class SubprocessTestResultsParser implements Closeable {
                     } else {
                         InvocationMetricLogger.addInvocationMetrics(key, val);
                     }
-                    attributes.remove(key.toString());
                 }
                 if (attributes.containsKey(TfObjectTracker.TF_OBJECTS_TRACKING_KEY)) {
                     String val = attributes.get(TfObjectTracker.TF_OBJECTS_TRACKING_KEY);
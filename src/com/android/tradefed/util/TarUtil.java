@@ -124,8 +124,7 @@ public class TarUtil {
     private static List<File> unTar(
             final File inputFile, final File outputDir, Predicate<String> shouldExtract)
             throws FileNotFoundException, IOException {
-        CLog.i(String.format("Untaring %s to dir %s.", inputFile.getAbsolutePath(),
-                outputDir.getAbsolutePath()));
+        CLog.i("Untaring %s to dir %s.", inputFile.getAbsolutePath(), outputDir.getAbsolutePath());
         final List<File> untaredFiles = new LinkedList<File>();
         final InputStream is = new FileInputStream(inputFile);
         TarArchiveInputStream debInputStream = null;
@@ -139,11 +138,13 @@ public class TarUtil {
                 }
                 final File outputFile = new File(outputDir, entry.getName());
                 if (entry.isDirectory()) {
-                    CLog.i(String.format("Attempting to write output directory %s.",
-                            outputFile.getAbsolutePath()));
+                    CLog.i(
+                            "Attempting to write output directory %s.",
+                            outputFile.getAbsolutePath());
                     if (!outputFile.exists()) {
-                        CLog.i(String.format("Attempting to create output directory %s.",
-                                outputFile.getAbsolutePath()));
+                        CLog.i(
+                                "Attempting to create output directory %s.",
+                                outputFile.getAbsolutePath());
                         if (!outputFile.mkdirs()) {
                             throw new IllegalStateException(
                                     String.format("Couldn't create directory %s.",
@@ -151,7 +152,7 @@ public class TarUtil {
                         }
                     }
                 } else {
-                    CLog.i(String.format("Creating output file %s.", outputFile.getAbsolutePath()));
+                    CLog.i("Creating output file %s.", outputFile.getAbsolutePath());
                     final File parent = outputFile.getParentFile();
                     if (parent != null && !parent.exists()) {
                         if (!parent.mkdirs()) {
@@ -188,8 +189,9 @@ public class TarUtil {
      */
     public static File unGzip(final File inputFile, final File outputDir)
             throws FileNotFoundException, IOException {
-        CLog.i(String.format("Ungzipping %s to dir %s.", inputFile.getAbsolutePath(),
-                outputDir.getAbsolutePath()));
+        CLog.i(
+                "Ungzipping %s to dir %s.",
+                inputFile.getAbsolutePath(), outputDir.getAbsolutePath());
         // rename '-3' to remove the '.gz' extension.
         final File outputFile = new File(outputDir, inputFile.getName().substring(0,
                 inputFile.getName().length() - 3));
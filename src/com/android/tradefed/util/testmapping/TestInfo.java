@@ -81,7 +81,8 @@ public class TestInfo {
      * be grouped by name the requirement on device.
      */
     public String getNameAndHostOnly() {
-        return String.format("%s - %s", mName, mHostOnly);
+        // Built for every grouping operation; plain concatenation skips format-string parsing.
+        return mName + " - " + mHostOnly;
     }
 
     /** Get a {@link Set} of the keywords supported by the test. */
@@ -270,33 +271,22 @@ public class TestInfo {
     public String toString() {
         StringBuilder string = new StringBuilder();
         string.append(mName);
+        // Join the streams directly into the builder, with no intermediate lists.
         if (!mOptions.isEmpty()) {
-            String options =
-                    String.format(
-                            "Options: %s",
-                            String.join(
-                                    ",",
-                                    mOptions.stream()
-                                            .sorted()
-                                            .map(TestOption::toString)
-                                            .collect(Collectors.toList())));
-            string.append("\n\t").append(options);
+            string.append("\n\tOptions: ")
+                    .append(
+                            mOptions.stream()
+                                    .sorted()
+                                    .map(TestOption::toString)
+                                    .collect(Collectors.joining(",")));
         }
         if (!mKeywords.isEmpty()) {
-            String keywords =
-                    String.format(
-                            "Keywords: %s",
-                            String.join(
-                                    ",", mKeywords.stream().sorted().collect(Collectors.toList())));
-            string.append("\n\t").append(keywords);
+            string.append("\n\tKeywords: ")
+                    .append(mKeywords.stream().sorted().collect(Collectors.joining(",")));
         }
         if (!mSources.isEmpty()) {
-            String sources =
-                    String.format(
-                            "Sources: %s",
-                            String.join(
-                                    ",", mSources.stream().sorted().collect(Collectors.toList())));
-            string.append("\n\t").append(sources);
+            string.append("\n\tSources: ")
+                    .append(mSources.stream().sorted().collect(Collectors.joining(",")));
         }
         string.append("\n\tHost: ").append(mHostOnly);
         return string.toString();
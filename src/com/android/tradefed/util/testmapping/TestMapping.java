@@ -22,6 +22,7 @@ import com.android.tradefed.util.FileUtil;
 import com.android.tradefed.util.ZipUtil2;
 
 import com.google.common.annotations.VisibleForTesting;
+import com.google.common.collect.ImmutableSet;
 
 import org.json.JSONArray;
 import org.json.JSONException;
@@ -36,7 +37,7 @@ import java.nio.file.Files;
 import java.nio.file.Path;
 import java.nio.file.Paths;
 import java.util.ArrayList;
-import java.util.Arrays;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.HashSet;
 import java.util.Iterator;
@@ -72,7 +73,7 @@ public class TestMapping {
     // Pattern used to identify comments start with "//" or "#" in TEST_MAPPING.
     private static final Pattern COMMENTS_REGEX = Pattern.compile(
             "(?m)[\\s\\t]*(//|#).*|(\".*?\")");
-    private static final Set<String> COMMENTS = new HashSet<>(Arrays.asList("#", "//"));
+    private static final Set<String> COMMENTS = ImmutableSet.of("#", "//");
 
     private static List<String> mTestMappingRelativePaths = new ArrayList<>();
 
@@ -136,8 +137,10 @@ public class TestMapping {
                             JSONArray optionObjects = testObject.getJSONArray(KEY_OPTIONS);
                             for (int j = 0; j < optionObjects.length(); j++) {
                                 JSONObject optionObject = optionObjects.getJSONObject(j);
-                                for (int k = 0; k < optionObject.names().length(); k++) {
-                                    String name = optionObject.names().getString(k);
+                                // names() builds a fresh JSONArray, only ask for it once.
+                                JSONArray optionNames = optionObject.names();
+                                for (int k = 0; k < optionNames.length(); k++) {
+                                    String name = optionNames.getString(k);
                                     String value = optionObject.getString(name);
                                     TestOption option = new TestOption(name, value);
                                     test.addOption(option);
@@ -198,22 +201,25 @@ public class TestMapping {
             String testGroup, Set<String> disabledTests, boolean hostOnly, Set<String> keywords) {
         Set<TestInfo> tests = new HashSet<TestInfo>();
 
-        for (TestInfo test : mTestCollection.getOrDefault(testGroup, new HashSet<>())) {
+        for (TestInfo test : mTestCollection.getOrDefault(testGroup, Collections.emptySet())) {
             if (disabledTests != null && disabledTests.contains(test.getName())) {
                 continue;
             }
             if (test.getHostOnly() != hostOnly) {
                 continue;
             }
+            // getKeywords returns a defensive copy, fetch it once per test instead of
+            // re-copying the set for every keyword check.
+            Set<String> testKeywords = test.getKeywords();
             // Skip the test if no keyword is specified but the test requires certain keywords.
-            if ((keywords == null || keywords.isEmpty()) && !test.getKeywords().isEmpty()) {
+            if ((keywords == null || keywords.isEmpty()) && !testKeywords.isEmpty()) {
                 continue;
             }
             // Skip the test if any of the required keywords is not specified by the test.
             if (keywords != null) {
-                Boolean allKeywordsFound = true;
+                boolean allKeywordsFound = true;
                 for (String keyword : keywords) {
-                    if (!test.getKeywords().contains(keyword)) {
+                    if (!testKeywords.contains(keyword)) {
                         allKeywordsFound = false;
                         break;
                     }
@@ -266,15 +272,24 @@ public class TestMapping {
     @VisibleForTesting
     static Set<Path> getAllTestMappingPaths(Path testMappingsRootPath) {
         Set<Path> allTestMappingPaths = new HashSet<>();
+        // Remember the probe result for each visited directory so ancestor directories shared
+        // between relative paths are only checked for a TEST_MAPPING file once.
+        Map<Path, Boolean> probedDirs = new HashMap<>();
         for (String path : mTestMappingRelativePaths) {
             boolean hasAdded = false;
             Path testMappingPath = testMappingsRootPath.resolve(path);
             // Recursively find the TEST_MAPPING file until reaching to testMappingsRootPath.
             while (!testMappingPath.equals(testMappingsRootPath)) {
-                if (testMappingPath.resolve(TEST_MAPPING).toFile().exists()) {
+                Path testMappingFile = testMappingPath.resolve(TEST_MAPPING);
+                Boolean exists = probedDirs.get(testMappingPath);
+                if (exists == null) {
+                    exists = testMappingFile.toFile().exists();
+                    probedDirs.put(testMappingPath, exists);
+                }
+                if (exists) {
                     hasAdded = true;
                     CLog.d("Adding TEST_MAPPING path: %s", testMappingPath);
-                    allTestMappingPaths.add(testMappingPath.resolve(TEST_MAPPING));
+                    allTestMappingPaths.add(testMappingFile);
                 }
                 testMappingPath = testMappingPath.getParent();
             }
@@ -315,16 +330,20 @@ public class TestMapping {
             else {
                 stream = getAllTestMappingPaths(testMappingsRootPath).stream();
             }
-            stream.filter(path -> path.getFileName().toString().equals(TEST_MAPPING))
-                    .forEach(
+            List<Path> testMappingPaths =
+                    stream.filter(path -> path.getFileName().toString().equals(TEST_MAPPING))
+                            .collect(Collectors.toList());
+            // Each TEST_MAPPING file is parsed independently, and large branches carry thousands
+            // of them, so parse in parallel. forEachOrdered serializes the merge of the per-file
+            // results so the plain HashSet stays safe.
+            testMappingPaths
+                    .parallelStream()
+                    .map(
                             path ->
-                                    tests.addAll(
-                                            new TestMapping(path, testMappingsRootPath)
-                                                    .getTests(
-                                                            testGroup,
-                                                            disabledTests,
-                                                            hostOnly,
-                                                            keywords)));
+                                    new TestMapping(path, testMappingsRootPath)
+                                            .getTests(
+                                                    testGroup, disabledTests, hostOnly, keywords))
+                    .forEachOrdered(tests::addAll);
 
         } catch (IOException e) {
             throw new RuntimeException(
@@ -355,10 +374,22 @@ public class TestMapping {
         try {
             Path testMappingsRootPath = Paths.get(testMappingsDir.getAbsolutePath());
             stream = Files.walk(testMappingsRootPath, FileVisitOption.FOLLOW_LINKS);
-            stream.filter(path -> path.getFileName().toString().equals(TEST_MAPPING))
-                    .forEach(
-                            path ->
-                                    getAllTests(allTests, path, testMappingsRootPath));
+            List<Path> testMappingPaths =
+                    stream.filter(path -> path.getFileName().toString().equals(TEST_MAPPING))
+                            .collect(Collectors.toList());
+            // Parse the files in parallel like getTests(); forEachOrdered serializes the merge
+            // into the shared map.
+            testMappingPaths
+                    .parallelStream()
+                    .map(path -> new TestMapping(path, testMappingsRootPath).getTestCollection())
+                    .forEachOrdered(
+                            testCollection -> {
+                                for (Map.Entry<String, Set<TestInfo>> entry :
+                                        testCollection.entrySet()) {
+                                    allTests.computeIfAbsent(entry.getKey(), k -> new HashSet<>())
+                                            .addAll(entry.getValue());
+                                }
+                            });
 
         } catch (IOException e) {
             throw new RuntimeException(
@@ -409,10 +440,10 @@ public class TestMapping {
             return disabledTests;
         }
         try {
-            disabledTests.addAll(
-                    Arrays.asList(
-                            FileUtil.readStringFromFile(disabledPresubmitTestsFile)
-                                    .split("\\r?\\n")));
+            // Collections.addAll skips the temporary List wrapper Arrays.asList would create.
+            Collections.addAll(
+                    disabledTests,
+                    FileUtil.readStringFromFile(disabledPresubmitTestsFile).split("\\r?\\n"));
         } catch (IOException e) {
             throw new RuntimeException(
                     String.format(
@@ -422,23 +453,6 @@ public class TestMapping {
         return disabledTests;
     }
 
-    /**
-     * Helper to find all tests in the TEST_MAPPING files from a given directory.
-     *
-     * @param allTests the {@code HashMap<String, Set<TestInfo>>} containing the tests of each
-     * test group.
-     * @param path the {@link Path} to a TEST_MAPPING file.
-     * @param testMappingsRootPath the {@link Path} to a test mappings zip path.
-     */
-    private static void getAllTests(Map<String, Set<TestInfo>> allTests,
-        Path path, Path testMappingsRootPath) {
-        Map<String, Set<TestInfo>> testCollection =
-            new TestMapping(path, testMappingsRootPath).getTestCollection();
-        for (String group : testCollection.keySet()) {
-            allTests.computeIfAbsent(group, k -> new HashSet<>()).addAll(testCollection.get(group));
-        }
-    }
-
     /**
      * Helper to get the test collection in a TEST_MAPPING file.
      *
@@ -92,6 +92,7 @@ public class TestOption implements Comparable<TestOption> {
 
     @Override
     public String toString() {
-        return String.format("%s:%s", mName, mValue);
+        // hashCode() funnels through here for every set operation, so skip format parsing.
+        return mName + ":" + mValue;
     }
 }